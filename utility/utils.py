@@ -10,22 +10,73 @@ import adafruit_ltr390
 import adafruit_ens160
 import adafruit_ahtx0
 from busio import I2C
+import numpy as np
 import picamera2
 import datetime
-import inspect
 import asyncio
+import orjson
+import socket
+import struct
 import time
-import sys
 import os
 
 
-def find_median_data(data_list) -> Union[int, float, tuple, None]:
-	if data_list:
-		if len(data_list) == config.NUM_READINGS:
-			data_list.sort()
-			return data_list[int(len(data_list)/2)]
-	return None
+def find_median_data(data: np.ndarray) -> np.ndarray:
+	# Partition each column instead of sorting; for even row counts k picks the lower middle
+	k = (data.shape[0] - 1) // 2
+	return np.partition(data, k, axis=0)[k]
 	
+class ReadingBuffer(object):
+	"""
+		ReadingBuffer stores readings as a preallocated (readings x attributes) array
+	"""
+	
+	def __init__(self, columns: Dict[str, type], size: int=config.NUM_READINGS) -> None:
+		self.__size = size
+		self.__columns = {key: index for index, key in enumerate(columns)}
+		self.__casts = tuple(columns.values())
+		self.__buffer = np.full((size, len(columns)), np.nan)
+		self.__index = 0
+		
+	def keys(self):
+		return self.__columns.keys()
+		
+	def reset(self) -> None:
+		"""
+			Method for discarding readings without reallocating the buffer
+		"""
+		self.__index = 0
+		
+	def push(self, readings: Dict[str, Union[int, float]]) -> None:
+		"""
+			Method for writing one row of readings, attributes missing from it are left NaN
+				*args -> dict str attribute name : int/float reading
+		"""
+		row = self.__buffer[self.__index % self.__size]
+		row.fill(np.nan)
+		for key, value in readings.items():
+			row[self.__columns[key]] = value
+		self.__index += 1
+		
+	def latest(self, key: str) -> Union[int, float, None]:
+		if not self.__index:
+			return None
+		column = self.__columns[key]
+		value = self.__buffer[(self.__index - 1) % self.__size, column]
+		return None if np.isnan(value) else self.__casts[column](value)
+		
+	def medians(self) -> Dict[str, Union[int, float, None]]:
+		"""
+			Method for returning each attribute's median, None if it is short of readings
+		"""
+		if self.__index < self.__size:
+			return dict.fromkeys(self.__columns)
+			
+		medians = find_median_data(self.__buffer)
+		complete = ~np.isnan(self.__buffer).any(axis=0)
+		return {key: self.__casts[column](medians[column]) if complete[column] else None
+				for key, column in self.__columns.items()}
+				
 class Controller(object):
 	"""
 		Controller handles sensor object creation, management, and data collection
@@ -53,7 +104,19 @@ class Controller(object):
 		self.__XLSXWriter = local_writer
 		self.__object_map = self._create_object_map()
 		self.__current_objects = self._create_objects()
+		sensors_by_kind = {}
+		for obj in self.__current_objects:
+			sensors_by_kind.setdefault(obj.KIND, obj)
+		self.__camera = sensors_by_kind.get("camera")
+		self.__aht21 = sensors_by_kind.get("aht")
+		self.__co2 = sensors_by_kind.get("co2")
+		self.__polled_objects = self._order_polled_objects()
+		self.__concurrent_objects = [obj for obj in self.__polled_objects if obj is not self.__aht21]
+		self.__copy_tasks = set()
 		self.__last_data = None
+		self.__last_labels = None
+		self.data_ready = asyncio.Event()
+		self.next_reading_at = time.monotonic()
 		
 	def _create_power_pins(self, power_pin_map: dict) -> dict:
 		"""
@@ -71,17 +134,9 @@ class Controller(object):
 		
 	def _create_object_map(self) -> dict:
 		"""
-			Method for generating str -> class map
+			Method for returning the str -> class map built at import time
 		"""
-		logger.info("Mapping existing classes...")
-		object_map = {}
-		
-		for name, obj in inspect.getmembers(sys.modules[__name__]):
-			if inspect.isclass(obj):
-				object_map[name] = obj
-		logger.info("Mapping complete.")
-		
-		return object_map
+		return _OBJECT_MAP
 		
 	def _create_objects(self) -> list:
 		"""
@@ -104,71 +159,62 @@ class Controller(object):
 		logger.info("Generation complete.")
 		return objects
 		
+	def _order_polled_objects(self) -> list:
+		"""
+			Method for listing non-camera sensors in polling order, CO2 after AHT21
+		"""
+		polled_objects = [obj for obj in self.__current_objects if obj is not self.__camera]
+		
+		# CO2 compensation uses the AHT21 readings, so it must be polled after it
+		if self.__aht21 is not None and self.__co2 is not None:
+			polled_objects.remove(self.__co2)
+			polled_objects.append(self.__co2)
+		return polled_objects
+		
 	async def _gather_sensor_data(self) -> None:
 		"""
 			Method for collecting all sensor object data
 		"""
-		aht21_exists = co2_exists = False
-		
-		for sensor in self.__current_objects:
-			if isinstance(sensor, TEMP_AHT21):
-				aht21_exists = True
-				aht21_index = self.__current_objects.index(sensor)
-			if isinstance(sensor, CO2_ENS160):
-				co2_exists = True
-				co2_index = self.__current_objects.index(sensor)
-			if isinstance(sensor, Camera):
-				full_image_path = await sensor.capture_image()
-				if config.STORE_LOCAL and config.SCP_COPY:
-					await self._ssh_copy_to_hub(full_image_path)
-	
-		if aht21_exists and co2_exists:
-			if co2_index < aht21_index:
-				self.__current_objects.append(self.__current_objects.pop(co2_index))
-	
+		if self.__camera is not None:
+			full_image_path = await self.__camera.capture_image()
+			if config.STORE_LOCAL and config.SCP_COPY:
+				# Upload in the background so the copy overlaps the sensor readings
+				copy_task = asyncio.create_task(self._ssh_copy_to_hub(full_image_path))
+				self.__copy_tasks.add(copy_task)
+				copy_task.add_done_callback(self.__copy_tasks.discard)
+				
 		for _ in range(config.NUM_READINGS):
-			for sensor in self.__current_objects:
-
-				if isinstance(sensor, Camera):
-					continue
-				elif isinstance(sensor, TEMP_AHT21):
-					if co2_exists:
-						await sensor.collect_data_for_median()
-						aht21_temperature = await sensor.get_temperature()
-						aht21_humidity = await sensor.get_humidity()
-					else:
-						await sensor.collect_data_for_median()
-				elif isinstance(sensor, CO2_ENS160):
-					if aht21_exists:
-						sensor.temperature_compensation = aht21_temperature
-						sensor.humidity_compensation = aht21_humidity
-						await sensor.collect_data_for_median()
-					else:
-						await sensor.collect_data_for_median()
-				else:
-					await sensor.collect_data_for_median()
-			time.sleep(config.TIME_BETWEEN_READINGS)
+			# AHT21 goes first so CO2 compensation is current, the rest share no state
+			if self.__aht21 is not None:
+				await self.__aht21.collect_data_for_median()
+				if self.__co2 is not None:
+					self.__co2.temperature_compensation = await self.__aht21.get_temperature()
+					self.__co2.humidity_compensation = await self.__aht21.get_humidity()
+			await asyncio.gather(*(sensor.collect_data_for_median() for sensor in self.__concurrent_objects))
+			await asyncio.sleep(config.TIME_BETWEEN_READINGS)
 			
 	async def get_data(self) -> None:
 		while True:
+			# Only the sensor reads need the bus, packaging and the wait happen unlocked
 			async with self.__i2c_lock:
 				logger.info("Collecting data...")
 				await self._gather_sensor_data()
 				
-				sensor_data: Dict[str, Dict[str, Any]] = {}
-				for sensor in self.__current_objects:
-					if isinstance(sensor, Camera):
-						continue
-					data = await sensor.package()
-					if data is not None:
-						sensor_data.update(data)
-						sensor.reset_sensor_data()
-				logger.info("Collection complete.")
-				logger.info(f"Collected at: {datetime.datetime.now().strftime('%m-%d-%Y@%H:%M:%S')}")
-				self.__last_data = sensor_data
-				next_reading = await self._calc_next_reading()
-				
-				# code for transmitting
+			sensor_data: Dict[str, Dict[str, Any]] = {}
+			for sensor in self.__polled_objects:
+				data = await sensor.package()
+				if data is not None:
+					sensor_data.update(data)
+					sensor.reset_sensor_data()
+			logger.info("Collection complete.")
+			logger.info(f"Collected at: {datetime.datetime.now().strftime('%m-%d-%Y@%H:%M:%S')}")
+			self.__last_data = sensor_data
+			self.__last_labels = self._create_labels(sensor_data)
+			next_reading = await self._calc_next_reading()
+			self.next_reading_at = time.monotonic() + next_reading
+			self.data_ready.set()
+			
+			# code for transmitting
 			
 			await asyncio.sleep(next_reading)
 			
@@ -179,14 +225,19 @@ class Controller(object):
 		"""
 		logger.info("Copying image to hub...")
 		
-		if os.path.exists(image_path):
-			copy_command = f"scp {image_path} {config.USERNAME}@{config.IP_ADDRESS}:{config.DESTINATION_COPY_PATH}"
-			os.system(copy_command)
-			
+		if image_path is not None and os.path.exists(image_path):
+			process = await asyncio.create_subprocess_exec(
+				"scp",
+				image_path,
+				f"{config.USERNAME}@{config.IP_ADDRESS}:{config.DESTINATION_COPY_PATH}",
+				stdout=asyncio.subprocess.DEVNULL)
+			if await process.wait() != 0:
+				logger.error(f"Error: scp exited with {process.returncode} when copying {image_path}.")
+				return
+				
 			# Remove image from local directory if not wanting to store locally (saves storage space)
 			if not self.__store_locally:
-				del_command = f"rm {image_path}"
-				os.system(del_command)
+				os.unlink(image_path)
 				
 	async def _write_to_file(self, data: dict) -> None:
 		"""
@@ -210,9 +261,22 @@ class Controller(object):
 		
 		return next_reading
 		
+	def _create_labels(self, sensor_data: dict) -> dict:
+		"""
+			Method for building LCD row labels once per published data set
+				*args -> dict sensor data
+		"""
+		labels = {}
+		for sensor, data in sensor_data.items():
+			labels[sensor] = {reading: f"{reading[:8]} : " for reading in data if reading != "Node"}
+		return labels
+		
 	async def get_last_data(self) -> Union[dict, None]:
 		return self.__last_data
 		
+	async def get_last_labels(self) -> Union[dict, None]:
+		return self.__last_labels
+		
 class Client(object):
 	
 	CLIENT_TIMEOUT = 10 # in seconds
@@ -221,12 +285,12 @@ class Client(object):
 		self.__host = host
 		self.__port = port
 		
-	async def package_data(self, data) -> bytes:
-		packaged_data = json.dumps(data).encode("utf-8")
+	def package_data(self, data) -> bytes:
+		packaged_data = orjson.dumps(data)
 		return packaged_data
 		
 	async def transmit(self, data) -> None:
-		packaged_data = await self.package_data(data)
+		packaged_data = self.package_data(data)
 		try:
 			with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
 				sock.connect((self.__host, self.__port))
@@ -239,6 +303,10 @@ class Camera(picamera2.Picamera2):
 	"""
 		Camera handles all image/video creation
 	"""
+	
+	KIND = "camera"
+	SETTLE_TIME = 2.0 # in seconds
+	
 	# Set log level to error to remove unneccessary data from logs
 	picamera2.Picamera2.set_logging(picamera2.Picamera2.ERROR)
 	
@@ -251,6 +319,16 @@ class Camera(picamera2.Picamera2):
 		self.__file_format = file_format
 		self.__use_timestamp = use_timestamp
 		
+		# Configure and start once, the pipeline stays warm between captures
+		configuration = self.create_still_configuration(
+			main={"size": self.__dimensions},
+			transform=Transform(vflip=1, hflip=1),
+			raw=self.sensor_modes[3]
+		)
+		self.configure(configuration)
+		self.start(show_preview=False)
+		self.__settled_at = time.monotonic() + Camera.SETTLE_TIME
+		
 	@property
 	def _image_name(self) -> str:
 		"""
@@ -266,26 +344,21 @@ class Camera(picamera2.Picamera2):
 		"""
 		try:
 			logger.info("Capturing image...")
-			configuration = self.create_still_configuration(
-				main={"size": self.__dimensions},
-				transform=Transform(vflip=1, hflip=1),
-				raw=self.sensor_modes[3]
-			)
-			
-			self.configure(configuration)
-			self.start(show_preview=False)
-			
-			await asyncio.sleep(2.0)
 			
+			# Only the first capture after start needs to wait for exposure to settle
+			settle_time = self.__settled_at - time.monotonic()
+			if settle_time > 0:
+				await asyncio.sleep(settle_time)
+				
 			full_image_path = config.IMAGE_STORE_PATH+self._image_name+f".{self.__file_format}"
-			self.capture_file(
+			await asyncio.to_thread(
+				self.capture_file,
 				file_output=full_image_path,
 				name="main",
 				format=self.__file_format,
 				wait=True
 			)
 			
-			self.stop()
 			logger.info("Image successfully captured.")
 			return full_image_path
 		except RuntimeError as runtime_error:
@@ -312,15 +385,20 @@ class LCD(CharLCD):
 			Method for displaying information on LCD display
 		"""
 		while True:
+			# Wake only when the controller publishes a new data set
+			await self.__sensor_log.data_ready.wait()
+			self.__sensor_log.data_ready.clear()
+			
 			async with self.__i2c_lock:
 				await self._write_to_screen()
-			await asyncio.sleep(1.0)
+			await self._count_down()
 					
-	async def _display_sensor_data(self, sensor: str, data: dict) -> None:
+	async def _display_sensor_data(self, sensor: str, data: dict, labels: dict) -> None:
 		"""
 			Method for cycling data on screen
 				sensor --> str sensor name
 				data --> dict sensor data
+				labels --> dict reading name : row label
 		"""
 		self.clear()
 		
@@ -329,15 +407,13 @@ class LCD(CharLCD):
 		self.write_string(sensor)
 		
 		row = 1
-		for reading in data:
-			if reading == "Node":
-				continue
-				
+		for reading, label in labels.items():
+			value = data[reading]
 			self.cursor_pos = (row, 0)
-			if isinstance(data[reading], (tuple, int)):
-				self.write_string(f"{reading[:8]} : {data[reading]}")
+			if isinstance(value, (tuple, int)):
+				self.write_string(label + str(value))
 			else:
-				self.write_string(f"{reading[:8]} : {data[reading]:.2f}")
+				self.write_string(label + f"{value:.2f}")
 				
 			row += 1
 			if row == 4:
@@ -349,18 +425,29 @@ class LCD(CharLCD):
 				
 	async def _write_to_screen(self) -> None:
 		self.__last_data = await self.__sensor_log.get_last_data()
+		labels = await self.__sensor_log.get_last_labels()
 		
 		if self.__last_data is not None:
 			# Display sensor data to LCD
 			for sensor, data in self.__last_data.items():
-				await self._display_sensor_data(sensor, data)
+				await self._display_sensor_data(sensor, data, labels[sensor])
 				await asyncio.sleep(config.LCD_DISPLAY_TIME)
 				
-			# Display estimated time to next read on LCD
-			current_time = datetime.datetime.now()
-			time_until_next_reading = (20 - (current_time.minute % 20)) * 60 + (60 - current_time.second)
-			messages = ("Next Reading", f"in {time_until_next_reading:.2f}", "seconds")
-			await self.display_messages(messages)
+	async def _count_down(self) -> None:
+		"""
+			Method for displaying estimated time to next read until new data is ready
+		"""
+		self.clear()
+		for row, message in ((0, "Next Reading"), (2, "seconds")):
+			self.cursor_pos = (row, (20 - len(message))//2)
+			self.write_string(message)
+			
+		# Only the countdown row is rewritten each second, without taking the I2C lock
+		while not self.__sensor_log.data_ready.is_set():
+			time_until_next_reading = max(0, int(self.__sensor_log.next_reading_at - time.monotonic()))
+			self.cursor_pos = (1, 0)
+			self.write_string(f"{f'in {time_until_next_reading}':^20}")
+			await asyncio.sleep(1.0)
 			
 	async def display_messages(self, messages: Union[str, Tuple[str]]) -> None:
 		self.clear()
@@ -379,25 +466,35 @@ class LCD(CharLCD):
 			raise ValueError("Invalid input for messages: got {type(messages)}, expected str or tuple.")
 			
 class TEMP_AHT21(adafruit_ahtx0.AHTx0):
+	
+	KIND = "aht"
+	
 	def __init__( self, i2c_bus: I2C, address: int = config.AHT21_ADDRESS ) -> None:
 		super().__init__(i2c_bus, address)
+		self.__AHT_buffer = ReadingBuffer({
+			"temperature" : float,
+			"relative_humidity" : float
+		})
 		self.reset_sensor_data()
 		
 	def reset_sensor_data(self) -> None:
-		self.__AHT_data = {
-			"temperature" : [],
-			"relative_humidity" : []
-		}
+		self.__AHT_buffer.reset()
+		
+	def read_all_raw(self) -> Dict[str, float]:
+		"""
+			Method for reading temperature and humidity from a single measurement
+		"""
+		# Each driver property triggers its own measurement, one covers both
+		self._readdata()
+		return {"temperature" : self._temp, "relative_humidity" : self._humidity}
 		
 	async def collect_data_for_median(self) -> None:
-		for key in self.__AHT_data.keys():
-			self.__AHT_data[key].append(getattr(self, key))
+		readings = await asyncio.get_running_loop().run_in_executor(None, self.read_all_raw)
+		self.__AHT_buffer.push(readings)
 			
-	@property
 	async def _read(self) -> bool:
 		try:
-			for key in self.__AHT_data.keys():
-				self.__AHT_data[key] = find_median_data(self.__AHT_data[key])
+			self.__AHT_data = self.__AHT_buffer.medians()
 			return True
 		except RuntimeError as runtime_error:
 			logger.error(f"Error: {runtime_error} when attempting to read TEMP_AHT21.")
@@ -405,51 +502,58 @@ class TEMP_AHT21(adafruit_ahtx0.AHTx0):
 			
 	async def package(self) -> Union[dict, None]:
 		data = None
-		if await self._read:
+		if await self._read():
 			self.__AHT_data["Node"] = config.NODE
 			data = {"TEMP_AHT21" : self.__AHT_data}
 		return data
 		
 	async def get_temperature(self) -> Union[int, float]:
-		temp = self.__AHT_data["temperature"][0]
+		temp = self.__AHT_buffer.latest("temperature")
 		return temp if temp else 25
 		
 	async def get_humidity(self) -> Union[int, float]:
-		humidity = self.__AHT_data["relative_humidity"][0]
+		humidity = self.__AHT_buffer.latest("relative_humidity")
 		return humidity if humidity else 50
 		
 class CO2_ENS160(adafruit_ens160.ENS160):
+	
+	KIND = "co2"
+	
 	def __init__( self, i2c_bus: I2C, address: int = config.CO2_ADDRESS) -> None:
 		super().__init__(i2c_bus, address)
+		self.__CO2_buffer = ReadingBuffer({
+			"AQI" : int,
+			"TVOC" : int,
+			"eCO2" : int
+		})
 		self.reset_sensor_data()
 		self.temperature_compensation = 25
 		self.humidity_compensation = 50
 		
 	def reset_sensor_data(self) -> None:
-		self.__CO2_data = {
-			"AQI" : [],
-			"TVOC" : [],
-			"eCO2" : []
-		}
+		self.__CO2_buffer.reset()
+		
+	def read_all_raw(self) -> Dict[str, int]:
+		"""
+			Method for reading AQI, TVOC, and eCO2 in one pass over the data registers
+		"""
+		readings = self.read_all_sensors()
+		return {key: readings[key] for key in ("AQI", "TVOC", "eCO2")}
 		
 	async def collect_data_for_median(self) -> None:
-		for key in self.__CO2_data.keys():
-			for _ in range(config.CO2_ATTEMPTS):
-				flag = False
-				reading = getattr(self, key)
-				if reading == 0:
-					time.sleep(config.TIME_BETWEEN_READINGS)
-				else:
-					self.__CO2_data[key].append(reading)
-					flag = True
-				if flag:
-					break
+		valid_readings = {}
+		for _ in range(config.CO2_ATTEMPTS):
+			readings = await asyncio.get_running_loop().run_in_executor(None, self.read_all_raw)
+			# A zero reading means the sensor hasn't produced valid data yet
+			valid_readings.update((key, value) for key, value in readings.items() if value != 0)
+			if len(valid_readings) == len(readings):
+				break
+			await asyncio.sleep(config.TIME_BETWEEN_READINGS)
+		self.__CO2_buffer.push(valid_readings)
 					
-	@property
 	async def _read(self) -> bool:
 		try:
-			for key in self.__CO2_data.keys():
-				self.__CO2_data[key] = find_median_data(self.__CO2_data[key])
+			self.__CO2_data = self.__CO2_buffer.medians()
 			return True
 		except RuntimeError as runtime_error:
 			logger.error(f"Error: {runtime_error} when attempting to read CO2_ENS160.")
@@ -457,36 +561,66 @@ class CO2_ENS160(adafruit_ens160.ENS160):
 			
 	async def package(self) -> Union[dict, None]:
 		data = None
-		if await self._read and all(self.__CO2_data[key] for key in self.__CO2_data.keys()):
+		if await self._read() and all(self.__CO2_data[key] for key in self.__CO2_data.keys()):
 			self.__CO2_data["Node"] = config.NODE
 			data = {"CO2_ENS160" : self.__CO2_data}
 		return data
 		
 	
 class RGB_TCS34725(adafruit_tcs34725.TCS34725):
+	
+	KIND = "other"
+	
 	def __init__( self, i2c_bus: I2C, address: int = config.RGB_ADDRESS, led_pin = config.RGB_LED_PIN ) -> None:
+		self.__raw_snapshot = None
 		super().__init__(i2c_bus, address)
 		self.__RGB_led = DigitalOutputDevice(pin=led_pin, active_high=True, initial_value=False)
 		self.__RGB_led.off()
+		self.__RGB_buffer = ReadingBuffer({
+			"color" : int,
+			"color_temperature" : float,
+			"lux" : float
+		})
 		self.reset_sensor_data()
 		
 	def reset_sensor_data(self) -> None:
-		self.__RGB_data = {
-			"color" : [],
-			"color_temperature" : [],
-			"lux" : [],
-			"color_rgb_bytes" : []
-		}
+		self.__RGB_buffer.reset()
+		
+	@property
+	def color_raw(self) -> Tuple[int, int, int, int]:
+		"""
+			Property method serving the snapshot taken by read_all_raw when one is active
+		"""
+		if self.__raw_snapshot is not None:
+			return self.__raw_snapshot
+		return super().color_raw
 		
+	def read_all_raw(self) -> Dict[str, Union[int, float]]:
+		"""
+			Method for deriving color, color temperature, and lux from one raw read
+		"""
+		# Every derived driver property re-reads color_raw, so pin one snapshot
+		self.__raw_snapshot = super().color_raw
+		try:
+			return {key: getattr(self, key) for key in self.__RGB_buffer.keys()}
+		finally:
+			self.__raw_snapshot = None
+			
 	async def collect_data_for_median(self) -> None:
-		for key in self.__RGB_data.keys():
-			self.__RGB_data[key].append(getattr(self, key))
+		readings = await asyncio.get_running_loop().run_in_executor(None, self.read_all_raw)
+		self.__RGB_buffer.push(readings)
 			
-	@property
 	async def _read(self) -> bool:
 		try:
-			for key in self.__RGB_data.keys():
-				self.__RGB_data[key] = find_median_data(self.__RGB_data[key])
+			self.__RGB_data = self.__RGB_buffer.medians()
+			
+			# color packs color_rgb_bytes into one int with the same ordering,
+			# so its median unpacks to the median byte tuple
+			color = self.__RGB_data["color"]
+			if color is not None:
+				self.__RGB_data["color_rgb_bytes"] = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+			else:
+				self.__RGB_data["color_rgb_bytes"] = None
 			return True
 		except RuntimeError as runtime_error:
 			logger.error(f"Error: {runtime_error} when attempting to read RGB_TCS34725.")
@@ -494,31 +628,51 @@ class RGB_TCS34725(adafruit_tcs34725.TCS34725):
 			
 	async def package(self) -> Union[dict, None]:
 		data = None
-		if await self._read:
+		if await self._read():
 			self.__RGB_data["Node"] = config.NODE
 			data = {"RGB_TCS34725" : self.__RGB_data}
 		return data
 		
 class IR_MLX90614(adafruit_mlx90614.MLX90614):
+	
+	KIND = "other"
+	AMBIENT_REGISTER = 0x06
+	OBJECT_REGISTER = 0x07
+	
 	def __init__( self, i2c_bus: I2C, address: int = config.MLX_ADDRESS ) -> None:
 		super().__init__(i2c_bus, address)
+		self.__raw_buffer = bytearray(2)
+		self.__MLX_buffer = ReadingBuffer({
+			"ambient_temperature" : float,
+			"object_temperature" : float
+		})
 		self.reset_sensor_data()
 		
 	def reset_sensor_data(self) -> None:
-		self.__MLX_data = {
-			"ambient_temperature" : [],
-			"object_temperature" : []
-		}
+		self.__MLX_buffer.reset()
+		
+	def read_all_raw(self) -> Dict[str, float]:
+		"""
+			Method for reading ambient and object temperature in one bus session
+		"""
+		readings = {}
+		# RAM words don't auto-increment, but both reads can share one bus lock
+		with self._device as i2c:
+			for key, register in (("ambient_temperature", IR_MLX90614.AMBIENT_REGISTER),
+								  ("object_temperature", IR_MLX90614.OBJECT_REGISTER)):
+				self.__raw_buffer[0] = register
+				i2c.write_then_readinto(self.__raw_buffer, self.__raw_buffer, out_end=1)
+				raw, = struct.unpack_from("<H", self.__raw_buffer)
+				readings[key] = raw * 0.02 - 273.15
+		return readings
 		
 	async def collect_data_for_median(self) -> None:
-		for key in self.__MLX_data.keys():
-			self.__MLX_data[key].append(getattr(self, key))
+		readings = await asyncio.get_running_loop().run_in_executor(None, self.read_all_raw)
+		self.__MLX_buffer.push(readings)
 			
-	@property
 	async def _read(self) -> bool:
 		try:
-			for key in self.__MLX_data.keys():
-				self.__MLX_data[key] = find_median_data(self.__MLX_data[key])
+			self.__MLX_data = self.__MLX_buffer.medians()
 			return True
 		except RuntimeError as runtime_error:
 			logger.error(f"Error: {runtime_error} when attempting to read IR_MLX90614.")
@@ -526,40 +680,75 @@ class IR_MLX90614(adafruit_mlx90614.MLX90614):
 			
 	async def package(self) -> Union[dict, None]:
 		data = None
-		if await self._read:
+		if await self._read():
 			self.__MLX_data["Node"] = config.NODE
 			data = {"IR_MLX90614" : self.__MLX_data}
 		return data
 		
 class UV_LTR390(adafruit_ltr390.LTR390):
+	
+	KIND = "other"
+	
 	def __init__( self, i2c_bus: I2C, address: int = config.LTR_ADDRESS ) -> None:
-		super().__init__(i2c_bus, addess)
+		self.__raw_snapshot = None
+		super().__init__(i2c_bus, address)
+		self.__LTR_buffer = ReadingBuffer({
+			"uvi" : float,
+			"lux" : float,
+			"light" : int,
+			"uvs" : int
+		})
 		self.reset_sensor_data()
 		
 	def reset_sensor_data(self) -> None:
-		self.__LTR_data = {
-			"uvi" : [],
-			"lux" : [],
-			"light" : [],
-			"uvs" : []
-		}
+		self.__LTR_buffer.reset()
 		
+	@property
+	def uvs(self) -> int:
+		"""
+			Property method serving the snapshot taken by read_all_raw when one is active
+		"""
+		if self.__raw_snapshot is not None:
+			return self.__raw_snapshot[0]
+		return super().uvs
+		
+	@property
+	def light(self) -> int:
+		"""
+			Property method serving the snapshot taken by read_all_raw when one is active
+		"""
+		if self.__raw_snapshot is not None:
+			return self.__raw_snapshot[1]
+		return super().light
+		
+	def read_all_raw(self) -> Dict[str, Union[int, float]]:
+		"""
+			Method for deriving uvi and lux from one UVS and one ALS conversion
+		"""
+		# uvi/lux re-read uvs/light (a mode switch and conversion wait each)
+		self.__raw_snapshot = (super().uvs, super().light)
+		try:
+			return {key: getattr(self, key) for key in self.__LTR_buffer.keys()}
+		finally:
+			self.__raw_snapshot = None
+			
 	async def collect_data_for_median(self) -> None:
-		for key in self.__LTR_data.keys():
-			self.__LTR_data[key].append(getattr(self, key))
+		readings = await asyncio.get_running_loop().run_in_executor(None, self.read_all_raw)
+		self.__LTR_buffer.push(readings)
 			
-	@property
 	async def _read(self) -> bool:
 		try:
-			for key in self.__LTR_data.keys():
-				self.__LTR_data[key] = find_median_data(self.__LTR_data[key])
+			self.__LTR_data = self.__LTR_buffer.medians()
 			return True
 		except RuntimeError as runtime_error:
 			logger.error(f"Error: {runtime_error} when attempting to read UV_LTR390.")
 			
 	async def package(self) -> Union[dict, None]:
 		data = None
-		if await self._read:
+		if await self._read():
 			self.__LTR_data["Node"] = config.NODE
 			data = {"UV_LTR390" : self.__LTR_data}
 		return data
+
+# str -> class map of everything defined or imported above, built once at import
+_OBJECT_MAP = {name: obj for name, obj in globals().items() if isinstance(obj, type)}